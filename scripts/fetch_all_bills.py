@@ -10,16 +10,22 @@ This script uses a two-step process:
 """
 
 import hashlib
+import io
+from collections import Counter
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
 from typing import Dict, List, Optional, Tuple
 import time
 import sys
+import threading
 import logging
 
 # Configure logging
@@ -53,10 +59,84 @@ YEAR = SESSION["year"]
 
 # XML Namespace
 NS = "http://WSLWebServices.leg.wa.gov/"
+NS_PREFIX = f"{{{NS}}}"  # Clark-notation prefix for qualified tag lookups
 
 # Rate limiting
 REQUEST_DELAY = 0.1  # seconds between API calls
+MAX_REQUEST_DELAY = 5.0  # Upper bound on the spacing after repeated 429/5xx responses
 BATCH_SIZE = 50  # Number of bills to fetch details for before saving progress
+MAX_WORKERS = 8  # Concurrent per-bill detail requests
+RECOVERY_SUCCESSES = 2 * MAX_WORKERS  # Consecutive successes before the spacing halves again
+MAX_RETRIES = 3  # Retries per request for connection errors, timeouts and 429/5xx
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})  # Transient API responses worth retrying
+
+
+def create_http_session() -> requests.Session:
+    """Create a requests session that keeps connections to the API alive.
+
+    The pool is sized to MAX_WORKERS so concurrent detail fetches each keep
+    their own connection instead of re-doing the TCP+TLS handshake per call.
+    The adapter does not retry: post_soap_request() retries instead, so
+    every attempt is spaced by RATE_LIMITER and reported back to it.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across all SOAP calls (requests sessions are safe to share between
+# the fetch worker threads for plain POSTs)
+HTTP_SESSION = create_http_session()
+
+
+class RateLimiter:
+    """Spaces API requests across all worker threads.
+
+    acquire() reserves the next send slot under a lock and sleeps outside
+    it, so the whole process keeps to one request per ``interval`` no
+    matter how many threads are fetching. The interval doubles (up to
+    ``max_interval``) when the API answers 429/5xx or the connection fails,
+    and halves back toward ``min_interval`` only after
+    ``recovery_successes`` successes in a row. With several requests in
+    flight, responses to calls sent before a backoff keep arriving after
+    it; halving on each of those would undo the backoff almost at once.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float,
+                 recovery_successes: int = RECOVERY_SUCCESSES):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.recovery_successes = recovery_successes
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until this caller's send slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, status_code: Optional[int]) -> None:
+        """Adjust the interval from a response status (None = request error)"""
+        with self._lock:
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.interval = min(self.interval * 2, self.max_interval)
+                self._successes = 0
+                return
+            self._successes += 1
+            if self._successes >= self.recovery_successes:
+                self.interval = max(self.interval / 2, self.min_interval)
+                self._successes = 0
+
+
+# Shared by every SOAP call; replaces the fixed per-call sleeps
+RATE_LIMITER = RateLimiter(REQUEST_DELAY, MAX_REQUEST_DELAY)
 
 
 def ensure_dirs():
@@ -65,6 +145,21 @@ def ensure_dirs():
     DEBUG_DIR.mkdir(exist_ok=True)
 
 
+def write_json_file(path: Path, data, ensure_ascii: bool = True):
+    """Serialize data once and atomically replace the file at path.
+
+    The JSON is rendered in a single json.dumps call and written as bytes to
+    a sibling temp file that is then os.replace()d over the target, so the
+    site and the validator never read a half-written file and a failed run
+    leaves the previous data in place.
+    """
+    payload = json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
 def build_soap_envelope(method: str, params: Dict[str, str]) -> str:
     """Build a SOAP 1.1 envelope for the given method and parameters"""
     param_xml = "\n".join([f"      <{k}>{v}</{k}>" for k, v in params.items()])
@@ -82,9 +177,9 @@ def build_soap_envelope(method: str, params: Dict[str, str]) -> str:
     return envelope
 
 
-def make_soap_request(service_url: str, method: str, params: Dict[str, str], 
-                      save_debug: bool = False, debug_name: str = "") -> Optional[ET.Element]:
-    """Make a SOAP request and return the parsed XML response"""
+def post_soap_request(service_url: str, method: str, params: Dict[str, str],
+                      save_debug: bool = False, debug_name: str = "") -> Optional[requests.Response]:
+    """Send a SOAP request and return the HTTP response, or None on failure"""
     envelope = build_soap_envelope(method, params)
     
     headers = {
@@ -92,53 +187,123 @@ def make_soap_request(service_url: str, method: str, params: Dict[str, str],
         "SOAPAction": f'"{NS}{method}"'
     }
     
-    try:
-        response = requests.post(
-            service_url,
-            data=envelope.encode('utf-8'),
-            headers=headers,
-            timeout=60
-        )
-        
-        if save_debug:
-            debug_file = DEBUG_DIR / f"{debug_name}_request.xml"
-            with open(debug_file, 'w') as f:
-                f.write(envelope)
-            debug_file = DEBUG_DIR / f"{debug_name}_response.xml"
-            with open(debug_file, 'w') as f:
-                f.write(response.text)
-        
-        if response.status_code != 200:
-            logger.error(f"HTTP {response.status_code} for {method}")
+    # Retry connection errors and transient statuses here rather than in the
+    # transport, so each attempt waits for its own RATE_LIMITER slot and the
+    # limiter backs off even when a later attempt succeeds. Every SOAP call
+    # is a read-only POST, so retrying is safe.
+    body = envelope.encode('utf-8')
+    for attempt in range(MAX_RETRIES + 1):
+        RATE_LIMITER.acquire()
+        try:
+            response = HTTP_SESSION.post(
+                service_url,
+                data=body,
+                headers=headers,
+                timeout=60
+            )
+        except requests.RequestException as e:
+            RATE_LIMITER.record(None)
+            if attempt < MAX_RETRIES:
+                logger.warning(f"Request error for {method}, retrying: {e}")
+                continue
+            logger.error(f"Request error for {method}: {e}")
             return None
-        
-        # Parse the response
-        root = ET.fromstring(response.content)
-        return root
-        
-    except requests.RequestException as e:
-        logger.error(f"Request error for {method}: {e}")
+        RATE_LIMITER.record(response.status_code)
+        if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            logger.warning(f"HTTP {response.status_code} for {method}, retrying")
+            continue
+        break
+
+    if save_debug:
+        debug_file = DEBUG_DIR / f"{debug_name}_request.xml"
+        with open(debug_file, 'w') as f:
+            f.write(envelope)
+        # Write the raw bytes: decoding the multi-MB roster bodies to str
+        # just to write them back out is wasted work.
+        debug_file = DEBUG_DIR / f"{debug_name}_response.xml"
+        with open(debug_file, 'wb') as f:
+            f.write(response.content)
+    
+    if response.status_code != 200:
+        snippet = response.content[:500].decode('utf-8', 'replace')
+        logger.error(f"HTTP {response.status_code} for {method}: {snippet}")
+        return None
+
+    return response
+
+
+def make_soap_request(service_url: str, method: str, params: Dict[str, str], 
+                      save_debug: bool = False, debug_name: str = "") -> Optional[ET.Element]:
+    """Make a SOAP request and return the parsed XML response"""
+    response = post_soap_request(service_url, method, params, save_debug, debug_name)
+    if response is None:
         return None
+
+    try:
+        return ET.fromstring(response.content)
     except ET.ParseError as e:
         logger.error(f"XML parse error for {method}: {e}")
         return None
 
 
+def fetch_soap_records(service_url: str, method: str, params: Dict[str, str], tag_name: str,
+                       save_debug: bool = False, debug_name: str = "") -> List[Dict[str, str]]:
+    """
+    Make a SOAP request and return child_text_map() of each <tag_name> element.
+
+    Used for the large list responses (thousands of LegislationInfo entries).
+    The body is buffered in full, but iterparse lets each element be reduced
+    to its field map and cleared as soon as its end tag is read, so only the
+    emptied element shells stay attached to the root.
+
+    All or nothing: a response that fails to parse part-way through yields
+    [] rather than the rows read so far, so a truncated roster can never
+    pass for a complete one.
+    """
+    response = post_soap_request(service_url, method, params, save_debug, debug_name)
+    if response is None:
+        return []
+
+    qualified_tag = NS_PREFIX + tag_name
+    records = []
+    try:
+        for _, elem in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+            if elem.tag == qualified_tag or elem.tag == tag_name:
+                records.append(child_text_map(elem))
+                elem.clear()
+    except ET.ParseError as e:
+        logger.error(f"XML parse error for {method} after {len(records)} {tag_name} elements; "
+                     f"discarding the response: {e}")
+        return []
+    return records
+
+
+@lru_cache(maxsize=256)
 def strip_namespace(tag: str) -> str:
-    """Remove namespace prefix from XML tag"""
-    if '}' in tag:
-        return tag.split('}')[1]
-    return tag
+    """Remove namespace prefix from XML tag.
+
+    Cached: responses use a few dozen distinct tags, and the fallback
+    walks below call this for every child they visit.
+    """
+    return tag.rpartition('}')[2]
+
+
+@lru_cache(maxsize=None)
+def qualify_path(path: str) -> str:
+    """Translate a path like 'YeaVotes/Count' to a namespaced descendant path"""
+    return ".//" + "/".join(NS_PREFIX + part for part in path.split("/"))
 
 
 def find_element_text(element: ET.Element, path: str, default: str = "") -> str:
     """Find element text, handling namespaces"""
-    # Try with namespace
-    ns_path = path.replace("/", f"/{{{NS}}}").lstrip("/")
-    if not ns_path.startswith("{"):
-        ns_path = f"{{{NS}}}{ns_path}"
-    
-    elem = element.find(f".//{ns_path}")
+    # Try with namespace. Fields are nearly always direct children, and a
+    # single qualified tag is resolved by ElementTree's C fast path; only
+    # fall back to the descendant search when that misses.
+    elem = None
+    if "/" not in path:
+        elem = element.find(NS_PREFIX + path)
+    if elem is None:
+        elem = element.find(qualify_path(path))
     if elem is not None and elem.text:
         return elem.text.strip()
     
@@ -158,12 +323,26 @@ def find_element_text(element: ET.Element, path: str, default: str = "") -> str:
     return current.text.strip() if current.text else default
 
 
+def child_text_map(element: ET.Element) -> Dict[str, str]:
+    """Map each direct child's local tag name to its stripped text.
+
+    One pass over the children for callers that read several flat fields
+    from the same element. The first child with a given name wins, as with
+    find().
+    """
+    fields = {}
+    for child in element:
+        name = strip_namespace(child.tag)
+        if name not in fields:
+            fields[name] = child.text.strip() if child.text else ""
+    return fields
+
+
 def find_all_elements(root: ET.Element, tag_name: str) -> List[ET.Element]:
     """Find all elements with the given tag name, handling namespaces"""
-    results = []
-    
-    # Try with namespace
-    results = root.findall(f".//{{{NS}}}{tag_name}")
+    # Try with namespace. iter() with a fully-qualified tag is matched in C,
+    # skipping the ElementPath parser that findall(".//...") goes through.
+    results = list(root.iter(NS_PREFIX + tag_name))
     
     # If not found, try iterating through all elements
     if not results:
@@ -181,44 +360,37 @@ def get_legislation_list_by_year(year: int) -> List[Dict]:
     """
     logger.info(f"Fetching legislation list for year {year}...")
     
-    root = make_soap_request(
+    legislation_infos = fetch_soap_records(
         LEGISLATION_SERVICE,
         "GetLegislationByYear",
         {"year": str(year)},
+        "LegislationInfo",
         save_debug=True,
-        debug_name="get_legislation_by_year"
+        debug_name=f"get_legislation_by_year_{year}"
     )
     
-    if root is None:
-        return []
-    
     bills = []
-    legislation_infos = find_all_elements(root, "LegislationInfo")
-    
-    logger.info(f"Found {len(legislation_infos)} LegislationInfo elements")
+    count = 0
     
-    for leg_info in legislation_infos:
-        bill_id = find_element_text(leg_info, "BillId")
-        bill_number = find_element_text(leg_info, "BillNumber")
-        biennium = find_element_text(leg_info, "Biennium")
-        short_leg_type = find_element_text(leg_info, "ShortLegislationType")
-        original_agency = find_element_text(leg_info, "OriginalAgency")
-        active_str = find_element_text(leg_info, "Active")
-        display_number = find_element_text(leg_info, "DisplayNumber")
+    for fields in legislation_infos:
+        count += 1
+        bill_id = fields.get("BillId", "")
+        active_str = fields.get("Active", "")
         
         active = active_str.lower() == "true" if active_str else True
         
         if bill_id:
             bills.append({
                 "bill_id": bill_id,
-                "bill_number": bill_number,
-                "biennium": biennium or BIENNIUM,
-                "short_leg_type": short_leg_type,
-                "original_agency": original_agency,
+                "bill_number": fields.get("BillNumber", ""),
+                "biennium": fields.get("Biennium") or BIENNIUM,
+                "short_leg_type": fields.get("ShortLegislationType", ""),
+                "original_agency": fields.get("OriginalAgency", ""),
                 "active": active,
-                "display_number": display_number
+                "display_number": fields.get("DisplayNumber", "")
             })
     
+    logger.info(f"Found {count} LegislationInfo elements")
     return bills
 
 
@@ -226,43 +398,37 @@ def get_prefiled_legislation() -> List[Dict]:
     """Get prefiled legislation for the biennium"""
     logger.info(f"Fetching prefiled legislation for biennium {BIENNIUM}...")
     
-    root = make_soap_request(
+    legislation_infos = fetch_soap_records(
         LEGISLATION_SERVICE,
         "GetPreFiledLegislationInfo",
         {"biennium": BIENNIUM},
+        "LegislationInfo",
         save_debug=True,
         debug_name="get_prefiled"
     )
     
-    if root is None:
-        return []
-    
     bills = []
-    legislation_infos = find_all_elements(root, "LegislationInfo")
+    count = 0
     
-    logger.info(f"Found {len(legislation_infos)} prefiled LegislationInfo elements")
-    
-    for leg_info in legislation_infos:
-        bill_id = find_element_text(leg_info, "BillId")
-        bill_number = find_element_text(leg_info, "BillNumber")
-        biennium = find_element_text(leg_info, "Biennium")
-        short_leg_type = find_element_text(leg_info, "ShortLegislationType")
-        original_agency = find_element_text(leg_info, "OriginalAgency")
-        active_str = find_element_text(leg_info, "Active")
+    for fields in legislation_infos:
+        count += 1
+        bill_id = fields.get("BillId", "")
+        active_str = fields.get("Active", "")
         
         active = active_str.lower() == "true" if active_str else True
         
         if bill_id:
             bills.append({
                 "bill_id": bill_id,
-                "bill_number": bill_number,
-                "biennium": biennium or BIENNIUM,
-                "short_leg_type": short_leg_type,
-                "original_agency": original_agency,
+                "bill_number": fields.get("BillNumber", ""),
+                "biennium": fields.get("Biennium") or BIENNIUM,
+                "short_leg_type": fields.get("ShortLegislationType", ""),
+                "original_agency": fields.get("OriginalAgency", ""),
                 "active": active,
                 "prefiled": True
             })
     
+    logger.info(f"Found {count} prefiled LegislationInfo elements")
     return bills
 
 
@@ -290,7 +456,8 @@ def get_legislation_details(biennium: str, bill_number: int) -> Optional[Dict]:
     # The API returns multiple versions if substitutes exist
     best_leg = None
     for leg in legislation_elements:
-        current_status = leg.find(f".//{{{NS}}}CurrentStatus")
+        # CurrentStatus is a direct child; a plain qualified tag hits the C fast path
+        current_status = leg.find(NS_PREFIX + "CurrentStatus")
         if current_status is None:
             # Try without namespace
             for child in leg:
@@ -299,32 +466,27 @@ def get_legislation_details(biennium: str, bill_number: int) -> Optional[Dict]:
                     break
         
         if current_status is not None:
-            bill_id = find_element_text(current_status, "BillId")
-            status = find_element_text(current_status, "Status")
-            history_line = find_element_text(current_status, "HistoryLine")
-            action_date = find_element_text(current_status, "ActionDate")
-            
+            # All fields are direct children, so read each element's
+            # children once instead of searching per field
+            status_fields = child_text_map(current_status)
+            bill_id = status_fields.get("BillId", "")
+
             # Get the details from this legislation element
-            short_desc = find_element_text(leg, "ShortDescription")
-            long_desc = find_element_text(leg, "LongDescription")
-            sponsor = find_element_text(leg, "Sponsor")
-            legal_title = find_element_text(leg, "LegalTitle")
-            introduced_date = find_element_text(leg, "IntroducedDate")
-            prime_sponsor_id = find_element_text(leg, "PrimeSponsorID")
-            requested_by_governor = find_element_text(leg, "RequestedByGovernor")
-            
+            fields = child_text_map(leg)
+            requested_by_governor = fields.get("RequestedByGovernor", "")
+
             result = {
                 "bill_id": bill_id,
-                "short_description": short_desc,
-                "long_description": long_desc,
-                "sponsor": sponsor,
-                "legal_title": legal_title,
-                "introduced_date": introduced_date,
-                "prime_sponsor_id": prime_sponsor_id,
-                "status": status,
-                "history_line": history_line,
-                "action_date": action_date,
-                "requested_by_governor": requested_by_governor.lower() == "true" if requested_by_governor else False
+                "short_description": fields.get("ShortDescription", ""),
+                "long_description": fields.get("LongDescription", ""),
+                "sponsor": fields.get("Sponsor", ""),
+                "legal_title": fields.get("LegalTitle", ""),
+                "introduced_date": fields.get("IntroducedDate", ""),
+                "prime_sponsor_id": fields.get("PrimeSponsorID", ""),
+                "status": status_fields.get("Status", ""),
+                "history_line": status_fields.get("HistoryLine", ""),
+                "action_date": status_fields.get("ActionDate", ""),
+                "requested_by_governor": requested_by_governor.lower() == "true"
             }
             
             # Prefer active versions
@@ -336,6 +498,55 @@ def get_legislation_details(biennium: str, bill_number: int) -> Optional[Dict]:
     return best_leg
 
 
+def get_status_changes(begin_date: str, end_date: str) -> Optional[Dict[int, Dict]]:
+    """
+    Get every bill whose legislative status changed within a date range.
+    A single GetLegislativeStatusChangesByDateRange call covers the whole
+    biennium, so callers can find the bills that moved without requesting
+    each bill individually.
+
+    Returns a dict keyed by numeric bill number holding the latest change
+    (bill_id, status, history_line, action_date), or None if the request
+    failed so callers can fall back to per-bill polling.
+    """
+    logger.info(f"Fetching status changes from {begin_date} to {end_date}...")
+
+    root = make_soap_request(
+        LEGISLATION_SERVICE,
+        "GetLegislativeStatusChangesByDateRange",
+        {
+            "biennium": BIENNIUM,
+            "beginDate": f"{begin_date}T00:00:00",
+            "endDate": f"{end_date}T23:59:59"
+        }
+    )
+
+    if root is None:
+        return None
+
+    changes = {}
+    for elem in find_all_elements(root, "LegislativeStatus"):
+        fields = child_text_map(elem)
+        bill_id = fields.get("BillId", "")
+        _, num = extract_bill_number_from_id(bill_id)
+        if not num:
+            continue
+
+        action_date = fields.get("ActionDate", "")
+        latest = changes.get(num)
+        # A bill can move several times in the window; keep its latest action
+        if latest is None or action_date >= latest["action_date"]:
+            changes[num] = {
+                "bill_id": bill_id,
+                "status": fields.get("Status", ""),
+                "history_line": fields.get("HistoryLine", ""),
+                "action_date": action_date
+            }
+
+    logger.info(f"Found status changes for {len(changes)} bills")
+    return changes
+
+
 def get_roll_calls(biennium: str, bill_number: int) -> List[Dict]:
     """Fetch roll call votes for a bill from the LegislationService."""
     root = make_soap_request(
@@ -344,8 +555,6 @@ def get_roll_calls(biennium: str, bill_number: int) -> List[Dict]:
         {"biennium": biennium, "billNumber": str(bill_number)}
     )
 
-    time.sleep(REQUEST_DELAY)
-
     if root is None:
         return []
 
@@ -400,7 +609,7 @@ def parse_governor_action(history_line: str) -> Optional[dict]:
     # Try to extract a date from the history line (common format: MM/DD/YYYY or YYYY-MM-DD)
     delivered_date = ""
     signed_date = ""
-    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2})', history_line)
+    date_match = HISTORY_DATE_PATTERN.search(history_line)
     date_str = date_match.group(1) if date_match else ""
 
     if status == "awaiting" and date_str:
@@ -415,6 +624,19 @@ def parse_governor_action(history_line: str) -> Optional[dict]:
     }
 
 
+# Bill ID patterns, compiled once; IDs are parsed for every bill when
+# sorting, building stats and matching hearings
+BILL_ID_PATTERN = re.compile(r'^([A-Z0-9]*[A-Z])(\d+)$')
+PREFIXED_BILL_ID_PATTERN = re.compile(r'^(\d*[A-Z]+)(\d+)$')
+SIMPLE_BILL_ID_PATTERN = re.compile(r'^([A-Z]+)(\d+)$')
+TRAILING_NUMBER_PATTERN = re.compile(r'(\d+)$')
+
+# History line patterns
+HISTORY_DATE_PATTERN = re.compile(r'(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2})')
+CHAPTER_LAW_PATTERN = re.compile(r'c \d+ l \d{4}')
+
+
+@lru_cache(maxsize=16384)
 def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     """
     Extract the bill type prefix and numeric bill number from a bill ID.
@@ -423,6 +645,9 @@ def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
         '2SHB 1037' -> ('2SHB', 1037)
         'ESHB 1234' -> ('ESHB', 1234)
         'HB1001' -> ('HB', 1001)
+
+    Cached, since the same IDs are parsed again by sorting, stats, hearing
+    matching and manifest selection within a run.
     """
     bill_id = bill_id.strip()
     
@@ -436,17 +661,17 @@ def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     
     # Handle no space - find where letters end and numbers begin
     # Pattern: letters/digits prefix followed by pure digits
-    match = re.match(r'^([A-Z0-9]*[A-Z])(\d+)$', bill_id)
+    match = BILL_ID_PATTERN.match(bill_id)
     if match:
         return match.group(1), int(match.group(2))
     
     # Handle format like "2SHB1037" - prefix can have leading digit
-    match = re.match(r'^(\d*[A-Z]+)(\d+)$', bill_id)
+    match = PREFIXED_BILL_ID_PATTERN.match(bill_id)
     if match:
         return match.group(1), int(match.group(2))
     
     # Last resort - find number at end
-    match = re.search(r'(\d+)$', bill_id)
+    match = TRAILING_NUMBER_PATTERN.search(bill_id)
     if match:
         prefix = bill_id[:match.start()].strip()
         return prefix, int(match.group(1))
@@ -454,6 +679,46 @@ def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     return bill_id, 0
 
 
+# Order matters - check more specific topics first
+TOPIC_KEYWORDS = {
+    "Technology": ["technology", "internet", "data", "privacy", "cyber", "artificial intelligence", "broadband", "digital"],
+    "Education": ["education", "school", "student", "teacher", "college", "university", "learning", "eceap"],
+    "Tax & Revenue": ["tax", "revenue", "budget", "fiscal", "levy", "assessment"],
+    "Housing": ["housing", "rent", "tenant", "landlord", "zoning", "homeless", "dwelling"],
+    "Healthcare": ["health", "medical", "hospital", "mental", "behavioral", "insurance", "pharmacy", "drug"],
+    "Environment": ["environment", "climate", "energy", "pollution", "water", "salmon", "forest", "wildlife"],
+    "Transportation": ["transport", "road", "highway", "transit", "ferry", "vehicle", "driver", "traffic"],
+    "Public Safety": ["crime", "police", "safety", "justice", "court", "prison", "emergency", "fire"],
+    "Business": ["business", "commerce", "trade", "economy", "license", "employment", "worker", "labor"],
+    "Agriculture": ["farm", "agriculture", "livestock", "crop", "food"],
+    "Social Services": ["child", "family", "welfare", "benefit", "assistance", "disability"],
+}
+
+HIGH_PRIORITY_KEYWORDS = [
+    "emergency", "budget", "funding", "safety", "crisis", "urgent",
+    "appropriation", "revenue", "public safety", "health care",
+    "education funding", "housing", "transportation",
+    "child welfare", "fentanyl", "opioid", "homelessness",
+]
+LOW_PRIORITY_KEYWORDS = [
+    "technical", "clarifying", "housekeeping", "minor", "study", "report",
+    "commemorat", "proclaim", "memorializ", "designat", "renam",
+    "recogni", "joint memorial",
+]
+
+
+def compile_keywords(keywords: List[str]) -> re.Pattern:
+    """Compile substring keywords into one alternation scanned in C"""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# One precompiled pattern per category, searched in the same order as the
+# keyword lists; matches are plain substrings of the lowercased title
+TOPIC_PATTERNS = [(topic, compile_keywords(kws)) for topic, kws in TOPIC_KEYWORDS.items()]
+HIGH_PRIORITY_PATTERN = compile_keywords(HIGH_PRIORITY_KEYWORDS)
+LOW_PRIORITY_PATTERN = compile_keywords(LOW_PRIORITY_KEYWORDS)
+
+
 def determine_topic(title: str) -> str:
     """Determine bill topic from title keywords"""
     if not title:
@@ -461,23 +726,8 @@ def determine_topic(title: str) -> str:
     
     title_lower = title.lower()
     
-    # Order matters - check more specific topics first
-    topic_keywords = {
-        "Technology": ["technology", "internet", "data", "privacy", "cyber", "artificial intelligence", "broadband", "digital"],
-        "Education": ["education", "school", "student", "teacher", "college", "university", "learning", "eceap"],
-        "Tax & Revenue": ["tax", "revenue", "budget", "fiscal", "levy", "assessment"],
-        "Housing": ["housing", "rent", "tenant", "landlord", "zoning", "homeless", "dwelling"],
-        "Healthcare": ["health", "medical", "hospital", "mental", "behavioral", "insurance", "pharmacy", "drug"],
-        "Environment": ["environment", "climate", "energy", "pollution", "water", "salmon", "forest", "wildlife"],
-        "Transportation": ["transport", "road", "highway", "transit", "ferry", "vehicle", "driver", "traffic"],
-        "Public Safety": ["crime", "police", "safety", "justice", "court", "prison", "emergency", "fire"],
-        "Business": ["business", "commerce", "trade", "economy", "license", "employment", "worker", "labor"],
-        "Agriculture": ["farm", "agriculture", "livestock", "crop", "food"],
-        "Social Services": ["child", "family", "welfare", "benefit", "assistance", "disability"],
-    }
-    
-    for topic, keywords in topic_keywords.items():
-        if any(kw in title_lower for kw in keywords):
+    for topic, pattern in TOPIC_PATTERNS:
+        if pattern.search(title_lower):
             return topic
     
     return "General Government"
@@ -510,21 +760,9 @@ def determine_priority(title: str, requested_by_governor: bool = False,
 
     title_lower = title.lower()
 
-    high_keywords = [
-        "emergency", "budget", "funding", "safety", "crisis", "urgent",
-        "appropriation", "revenue", "public safety", "health care",
-        "education funding", "housing", "transportation",
-        "child welfare", "fentanyl", "opioid", "homelessness",
-    ]
-    low_keywords = [
-        "technical", "clarifying", "housekeeping", "minor", "study", "report",
-        "commemorat", "proclaim", "memorializ", "designat", "renam",
-        "recogni", "joint memorial",
-    ]
-
-    if any(kw in title_lower for kw in high_keywords):
+    if HIGH_PRIORITY_PATTERN.search(title_lower):
         return "high"
-    if any(kw in title_lower for kw in low_keywords):
+    if LOW_PRIORITY_PATTERN.search(title_lower):
         return "low"
 
     return "medium"
@@ -567,7 +805,7 @@ def normalize_status(status: str, history_line: str = "", original_agency: str =
         if "governor signed" in history_lower or "signed by governor" in history_lower:
             return "enacted"
         # "C 123 L 2025" pattern = chapter law reference
-        if re.match(r'c \d+ l \d{4}', history_lower):
+        if CHAPTER_LAW_PATTERN.match(history_lower):
             return "enacted"
         if "delivered to governor" in history_lower or "governor's desk" in history_lower:
             return "governor"
@@ -639,18 +877,36 @@ def format_bill_number(bill_id: str) -> str:
     
     # Handle complex prefixes like 2SHB1037, ESHB1234, 2SSB5001
     # Pattern: optional leading digits, letters, then the bill number
-    match = re.match(r'^(\d*[A-Z]+)(\d+)$', bill_id)
+    match = PREFIXED_BILL_ID_PATTERN.match(bill_id)
     if match:
         return f"{match.group(1)} {match.group(2)}"
     
     # Simple format like HB1001
-    match = re.match(r'^([A-Z]+)(\d+)$', bill_id)
+    match = SIMPLE_BILL_ID_PATTERN.match(bill_id)
     if match:
         return f"{match.group(1)} {match.group(2)}"
     
     return bill_id
 
 
+HOUSE_BILL_TYPES = ("HB", "HJR", "HJM", "HCR")
+SENATE_BILL_TYPES = ("SB", "SJR", "SJM", "SCR")
+
+
+def agency_for_prefix(prefix: str) -> str:
+    """Originating chamber for a bill prefix (e.g. 'ESHB' -> 'House').
+
+    Version markers (E, S, 2S...) only ever precede the type, so a suffix
+    match against each chamber's types is enough. Unknown prefixes are
+    returned unchanged.
+    """
+    if prefix.endswith(HOUSE_BILL_TYPES):
+        return "House"
+    if prefix.endswith(SENATE_BILL_TYPES):
+        return "Senate"
+    return prefix
+
+
 def get_leg_url(bill_number: int, bill_type: str = "") -> str:
     """Generate the leg.wa.gov URL for a bill"""
     return f"https://app.leg.wa.gov/billsummary?BillNumber={bill_number}&Year={YEAR}"
@@ -666,7 +922,19 @@ def compute_content_hash(status: str, history_line: str, action_date: str, spons
     return hashlib.md5(content.encode()).hexdigest()[:8]
 
 
-def build_bill_dict(details: Dict, original_agency: str) -> Dict:
+def bill_content_hash(bill: Dict) -> str:
+    """compute_content_hash() over a bill dict's tracked fields"""
+    return compute_content_hash(
+        bill.get("status", ""),
+        bill.get("historyLine", ""),
+        bill.get("introducedDate", ""),
+        bill.get("sponsor", "")
+    )
+
+
+def build_bill_dict(details: Dict, original_agency: str,
+                    previous: Optional[Dict] = None,
+                    now_iso: Optional[str] = None) -> Dict:
     """Build a standardized bill dictionary from API details.
 
     Extracts and normalizes fields from the raw API response into
@@ -676,6 +944,11 @@ def build_bill_dict(details: Dict, original_agency: str) -> Dict:
     Args:
         details: Raw bill details from get_legislation_details()
         original_agency: 'House' or 'Senate' based on bill prefix
+        previous: This bill's record from the last run, if any. Its votes
+            are reused when the history line is unchanged, since a new
+            roll call always comes with a new history action.
+        now_iso: Sync timestamp for lastUpdated. Callers building many bills
+            pass one value for the whole run; defaults to the current time.
 
     Returns:
         A bill dict ready for inclusion in bills.json
@@ -716,7 +989,7 @@ def build_bill_dict(details: Dict, original_agency: str) -> Dict:
         "priority": determine_priority(title, details.get("requested_by_governor", False), prefix),
         "topic": determine_topic(title),
         "introducedDate": introduced_date,
-        "lastUpdated": datetime.now().isoformat(),
+        "lastUpdated": now_iso or datetime.now().isoformat(),
         "legUrl": get_leg_url(num, prefix),
         "hearings": [],
         "active": True,
@@ -731,9 +1004,14 @@ def build_bill_dict(details: Dict, original_agency: str) -> Dict:
     vote_statuses = ("passed_origin", "opposite_committee", "opposite_floor",
                      "passed_legislature", "governor", "enacted")
     if status in vote_statuses:
-        bill_num = int(num)
-        votes = get_roll_calls(BIENNIUM, bill_num)
-        bill_dict["votes"] = votes
+        if (previous and previous.get("votes")
+                and previous.get("historyLine") == history_line):
+            bill_dict["votes"] = previous["votes"]
+        elif num:
+            votes = get_roll_calls(BIENNIUM, int(num))
+            bill_dict["votes"] = votes
+        else:
+            bill_dict["votes"] = []
     else:
         bill_dict["votes"] = []
 
@@ -836,6 +1114,15 @@ def get_meeting_agenda_items(agenda_id: int) -> List[Dict]:
     return items
 
 
+def fetch_agenda_items_safe(meeting: Dict) -> Optional[List[Dict]]:
+    """Fetch one meeting's agenda items for the worker pool; None on failure"""
+    try:
+        return get_meeting_agenda_items(meeting["agendaId"])
+    except Exception as e:
+        logger.warning(f"Failed to fetch agenda {meeting['agendaId']} (non-fatal): {e}")
+        return None
+
+
 def fetch_hearings_for_bills(bills: List[Dict]) -> None:
     """
     Fetch upcoming committee hearings and attach them to matching bills.
@@ -870,13 +1157,14 @@ def fetch_hearings_for_bills(bills: List[Dict]) -> None:
 
     hearings_attached = 0
 
-    for meeting in meetings:
-        time.sleep(REQUEST_DELAY)
+    # Agenda requests are independent, so overlap them on the worker pool.
+    # Results come back in meeting order, which keeps each bill's hearings
+    # in date order (the last one sets the committee field).
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        agendas = list(executor.map(fetch_agenda_items_safe, meetings))
 
-        try:
-            items = get_meeting_agenda_items(meeting["agendaId"])
-        except Exception as e:
-            logger.warning(f"Failed to fetch agenda {meeting['agendaId']} (non-fatal): {e}")
+    for meeting, items in zip(meetings, agendas):
+        if items is None:
             continue
 
         for item in items:
@@ -897,6 +1185,69 @@ def fetch_hearings_for_bills(bills: List[Dict]) -> None:
     logger.info(f"Attached {hearings_attached} hearing entries to bills")
 
 
+def load_previous_bills() -> Dict[int, Dict]:
+    """Load the last run's bills.json keyed by numeric bill number.
+
+    Lets a full fetch reuse data that only changes with a new history
+    action (roll calls) instead of requesting it again for every bill.
+    Returns an empty dict when there is no usable previous file.
+    """
+    bills_path = DATA_DIR / "bills.json"
+    if not bills_path.exists():
+        return {}
+    try:
+        with open(bills_path, "r", encoding="utf-8") as f:
+            bills = json.load(f).get("bills", [])
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Could not read previous bills.json: {e}")
+        return {}
+
+    previous = {}
+    for bill in bills:
+        _, num = extract_bill_number_from_id(bill.get("id", ""))
+        if num:
+            previous[num] = bill
+    return previous
+
+
+def roster_bill_number(info: Dict) -> int:
+    """Return the bill number for a roster entry, or 0 if it has none.
+
+    Prefers a positive BillNumber and falls back to parsing BillId, so
+    unusable entries are never queued for a details request.
+    """
+    try:
+        num = int(info.get("bill_number") or 0)
+    except ValueError:
+        num = 0
+    if num <= 0:
+        _, num = extract_bill_number_from_id(info.get("bill_id", ""))
+    return num
+
+
+def fetch_bill_record(bill_num: int, now_iso: Optional[str] = None,
+                      previous: Optional[Dict] = None) -> Optional[Dict]:
+    """Fetch details for one bill number and build its bill dict.
+
+    Safe to call from worker threads. Returns None when the API has no
+    details for the bill, or without a request when the number is invalid.
+    ``previous`` is passed through to build_bill_dict() for vote reuse.
+    """
+    if bill_num <= 0:
+        return None
+
+    details = get_legislation_details(BIENNIUM, bill_num)
+    if not details or not details.get("bill_id"):
+        return None
+
+    prefix, _ = extract_bill_number_from_id(details["bill_id"])
+
+    # Determine chamber/agency from bill prefix (needed for status detection)
+    original_agency = agency_for_prefix(prefix)
+
+    return build_bill_dict(details, original_agency, previous, now_iso)
+
+
 def fetch_all_bills() -> List[Dict]:
     """Main function to fetch all bills with full details"""
     logger.info("=" * 60)
@@ -907,18 +1258,28 @@ def fetch_all_bills() -> List[Dict]:
     ensure_dirs()
     
     all_bill_info = {}
-    
+    # Validated as entries are merged, so no second pass over the roster
+    bill_numbers_to_fetch = set()
+
+    # The three roster requests are independent, so issue them together.
+    # Merging below still happens in the original order.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        year_future = executor.submit(get_legislation_list_by_year, YEAR)
+        prefiled_future = executor.submit(get_prefiled_legislation)
+        prev_year_future = executor.submit(get_legislation_list_by_year, YEAR - 1)
+
     # Step 1: Get list of all bills from GetLegislationByYear
-    year_bills = get_legislation_list_by_year(YEAR)
+    year_bills = year_future.result()
     logger.info(f"GetLegislationByYear returned {len(year_bills)} bills")
     
     for bill in year_bills:
         key = bill.get("bill_number") or bill.get("bill_id")
         if key:
             all_bill_info[key] = bill
+            bill_numbers_to_fetch.add(roster_bill_number(bill))
     
     # Step 2: Get prefiled legislation
-    prefiled_bills = get_prefiled_legislation()
+    prefiled_bills = prefiled_future.result()
     logger.info(f"GetPreFiledLegislationInfo returned {len(prefiled_bills)} bills")
     
     for bill in prefiled_bills:
@@ -926,18 +1287,21 @@ def fetch_all_bills() -> List[Dict]:
         if key:
             if key not in all_bill_info:
                 all_bill_info[key] = bill
+                bill_numbers_to_fetch.add(roster_bill_number(bill))
             else:
                 all_bill_info[key]["prefiled"] = True
     
     # Also try previous year for carryover bills
-    prev_year_bills = get_legislation_list_by_year(YEAR - 1)
+    prev_year_bills = prev_year_future.result()
     logger.info(f"GetLegislationByYear ({YEAR - 1}) returned {len(prev_year_bills)} bills")
     
     for bill in prev_year_bills:
         key = bill.get("bill_number") or bill.get("bill_id")
         if key and key not in all_bill_info:
             all_bill_info[key] = bill
+            bill_numbers_to_fetch.add(roster_bill_number(bill))
     
+    bill_numbers_to_fetch.discard(0)
     logger.info(f"Total unique bills found: {len(all_bill_info)}")
     
     # Step 3: Get full details for each bill
@@ -948,49 +1312,31 @@ def fetch_all_bills() -> List[Dict]:
     processed = 0
     failed = 0
     
-    # Get unique bill numbers
-    bill_numbers_to_fetch = set()
-    for key, info in all_bill_info.items():
-        bill_num = info.get("bill_number")
-        if bill_num:
-            try:
-                num = int(bill_num)
-                bill_numbers_to_fetch.add(num)
-            except ValueError:
-                # Try extracting from bill_id
-                _, num = extract_bill_number_from_id(info.get("bill_id", ""))
-                if num:
-                    bill_numbers_to_fetch.add(num)
-    
     logger.info(f"Fetching details for {len(bill_numbers_to_fetch)} unique bill numbers...")
-    
-    for i, bill_num in enumerate(sorted(bill_numbers_to_fetch)):
-        if i > 0 and i % 100 == 0:
-            logger.info(f"Progress: {i}/{len(bill_numbers_to_fetch)} bills processed")
-        
-        # Add rate limiting
-        time.sleep(REQUEST_DELAY)
-        
-        details = get_legislation_details(BIENNIUM, bill_num)
-        
-        if details and details.get("bill_id"):
-            bill_id = details["bill_id"]
-            prefix, num = extract_bill_number_from_id(bill_id)
-
-            # Determine chamber/agency from bill prefix (needed for status detection)
-            if prefix.endswith("HB") or prefix.endswith("HJR") or prefix.endswith("HJM") or prefix.endswith("HCR"):
-                original_agency = "House"
-            elif prefix.endswith("SB") or prefix.endswith("SJR") or prefix.endswith("SJM") or prefix.endswith("SCR"):
-                original_agency = "Senate"
-            else:
-                original_agency = prefix
 
-            bill = build_bill_dict(details, original_agency)
-            final_bills.append(bill)
-            processed += 1
-        else:
-            failed += 1
-            logger.debug(f"No details found for bill number {bill_num}")
+    # Detail fetches are independent and network-bound, so overlap them on a
+    # small worker pool. executor.map preserves input order, keeping the
+    # output (and progress logging) deterministic.
+    sorted_numbers = sorted(bill_numbers_to_fetch)
+    now_iso = datetime.now().isoformat()
+    # Bills whose history line has not moved keep their stored roll calls
+    previous_by_number = load_previous_bills()
+    logger.info(f"Loaded {len(previous_by_number)} bills from the previous run for vote reuse")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda num: fetch_bill_record(num, now_iso, previous_by_number.get(num)),
+            sorted_numbers
+        )
+        for i, (bill_num, bill) in enumerate(zip(sorted_numbers, results)):
+            if i > 0 and i % 100 == 0:
+                logger.info(f"Progress: {i}/{len(sorted_numbers)} bills processed")
+
+            if bill is not None:
+                final_bills.append(bill)
+                processed += 1
+            else:
+                failed += 1
+                logger.debug(f"No details found for bill number {bill_num}")
     
     logger.info(f"Successfully processed {processed} bills, {failed} failed")
 
@@ -1014,18 +1360,26 @@ def fetch_all_bills() -> List[Dict]:
     return final_bills
 
 
+# Sort order: HB, SB, HJR, SJR, HJM, SJM, HCR, SCR, other
+BILL_TYPE_ORDER = {"HB": 1, "SB": 2, "HJR": 3, "SJR": 4, "HJM": 5, "SJM": 6, "HCR": 7, "SCR": 8}
+
+
+def bill_sort_key(bill: Dict) -> Tuple[int, int]:
+    """Sort key for bills.json: bill type, then bill number.
+
+    Computed once per bill by list.sort(key=...), so the comparisons
+    themselves are plain tuple compares.
+    """
+    prefix, num = extract_bill_number_from_id(bill.get("number", ""))
+    # Handle prefixes like 2SHB, ESHB, etc.
+    base_type = prefix[-2:] if len(prefix) >= 2 else prefix
+    return (BILL_TYPE_ORDER.get(base_type, 99), num)
+
+
 def save_bills_data(bills: List[Dict]) -> Dict:
     """Save bills data to JSON file"""
     # Sort bills by type then number
-    def sort_key(b):
-        prefix, num = extract_bill_number_from_id(b.get("number", ""))
-        # Sort order: HB, SB, HJR, SJR, HJM, SJM, HCR, SCR, other
-        type_order = {"HB": 1, "SB": 2, "HJR": 3, "SJR": 4, "HJM": 5, "SJM": 6, "HCR": 7, "SCR": 8}
-        # Handle prefixes like 2SHB, ESHB, etc.
-        base_type = prefix[-2:] if len(prefix) >= 2 else prefix
-        return (type_order.get(base_type, 99), num)
-    
-    bills.sort(key=sort_key)
+    bills.sort(key=bill_sort_key)
     
     data = {
         "lastSync": datetime.now().isoformat(),
@@ -1044,8 +1398,7 @@ def save_bills_data(bills: List[Dict]) -> Dict:
     }
     
     data_file = DATA_DIR / "bills.json"
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json_file(data_file, data, ensure_ascii=False)
     
     logger.info(f"Saved {len(bills)} bills to {data_file}")
     return data
@@ -1053,62 +1406,66 @@ def save_bills_data(bills: List[Dict]) -> Dict:
 
 def create_stats_file(bills: List[Dict]):
     """Create comprehensive statistics file"""
-    stats = {
-        "generated": datetime.now().isoformat(),
-        "totalBills": len(bills),
-        "byStatus": {},
-        "byCommittee": {},
-        "byPriority": {},
-        "byTopic": {},
-        "bySponsor": {},
-        "byType": {},
-        "byAgency": {},
-        "recentlyUpdated": 0,
-        "updatedToday": 0
-    }
-    
-    today = datetime.now().date()
-    
+    now = datetime.now()
+    today = now.date()
+
+    by_status = Counter()
+    by_committee = Counter()
+    by_priority = Counter()
+    by_topic = Counter()
+    by_sponsor = Counter()
+    by_type = Counter()
+    by_agency = Counter()
+    recently_updated = 0
+    updated_today = 0
+    # lastUpdated string -> (updated today, updated within 7 days). Bills
+    # fetched in the same run share one timestamp, so each distinct value
+    # is parsed once.
+    recency = {}
+
     for bill in bills:
-        # By status
-        status = bill.get('status', 'unknown')
-        stats['byStatus'][status] = stats['byStatus'].get(status, 0) + 1
-        
-        # By committee
-        committee = bill.get('committee') or 'Unassigned'
-        stats['byCommittee'][committee] = stats['byCommittee'].get(committee, 0) + 1
-        
-        # By priority
-        priority = bill.get('priority', 'unknown')
-        stats['byPriority'][priority] = stats['byPriority'].get(priority, 0) + 1
-        
-        # By topic
-        topic = bill.get('topic', 'unknown')
-        stats['byTopic'][topic] = stats['byTopic'].get(topic, 0) + 1
-        
-        # By sponsor
-        sponsor = bill.get('sponsor', 'unknown')
-        stats['bySponsor'][sponsor] = stats['bySponsor'].get(sponsor, 0) + 1
-        
+        by_status[bill.get('status', 'unknown')] += 1
+        by_committee[bill.get('committee') or 'Unassigned'] += 1
+        by_priority[bill.get('priority', 'unknown')] += 1
+        by_topic[bill.get('topic', 'unknown')] += 1
+        by_sponsor[bill.get('sponsor', 'unknown')] += 1
+
         # By type
         prefix, _ = extract_bill_number_from_id(bill.get('number', ''))
-        base_type = prefix[-2:] if len(prefix) >= 2 else prefix
-        stats['byType'][base_type] = stats['byType'].get(base_type, 0) + 1
-        
+        by_type[prefix[-2:] if len(prefix) >= 2 else prefix] += 1
+
         # By original agency (chamber)
-        agency = bill.get('originalAgency', 'Unknown')
-        stats['byAgency'][agency] = stats['byAgency'].get(agency, 0) + 1
-        
+        by_agency[bill.get('originalAgency', 'Unknown')] += 1
+
         # Recently updated
-        try:
-            last_updated = datetime.fromisoformat(bill.get('lastUpdated', '').replace('Z', '+00:00'))
-            if last_updated.date() == today:
-                stats['updatedToday'] += 1
-            if (datetime.now() - last_updated.replace(tzinfo=None)).days < 7:
-                stats['recentlyUpdated'] += 1
-        except (ValueError, TypeError):
-            pass
-    
+        last_updated_str = bill.get('lastUpdated', '')
+        flags = recency.get(last_updated_str)
+        if flags is None:
+            try:
+                last_updated = datetime.fromisoformat(last_updated_str.replace('Z', '+00:00'))
+                flags = (last_updated.date() == today,
+                         (now - last_updated.replace(tzinfo=None)).days < 7)
+            except (ValueError, TypeError, AttributeError):
+                flags = (False, False)
+            recency[last_updated_str] = flags
+        updated_today += flags[0]
+        recently_updated += flags[1]
+
+    # Counters keep first-seen order, so the JSON key order is unchanged
+    stats = {
+        "generated": now.isoformat(),
+        "totalBills": len(bills),
+        "byStatus": dict(by_status),
+        "byCommittee": dict(by_committee),
+        "byPriority": dict(by_priority),
+        "byTopic": dict(by_topic),
+        "bySponsor": dict(by_sponsor),
+        "byType": dict(by_type),
+        "byAgency": dict(by_agency),
+        "recentlyUpdated": recently_updated,
+        "updatedToday": updated_today
+    }
+
     # Top sponsors
     stats['topSponsors'] = sorted(
         stats['bySponsor'].items(),
@@ -1117,8 +1474,7 @@ def create_stats_file(bills: List[Dict]):
     )[:20]
     
     stats_file = DATA_DIR / "stats.json"
-    with open(stats_file, 'w') as f:
-        json.dump(stats, f, indent=2)
+    write_json_file(stats_file, stats)
     
     logger.info(f"Statistics saved to {stats_file}")
     logger.info(f"  - {len(stats['byStatus'])} statuses")
@@ -1142,21 +1498,14 @@ def generate_manifest(bills: List[Dict]):
 
     for bill in bills:
         bill_id = bill.get("id", "")
-        content_hash = compute_content_hash(
-            bill.get("status", ""),
-            bill.get("historyLine", ""),
-            bill.get("introducedDate", ""),
-            bill.get("sponsor", "")
-        )
         manifest["bills"][bill_id] = {
             "status": bill.get("status", ""),
-            "contentHash": content_hash,
+            "contentHash": bill_content_hash(bill),
             "lastFetched": now
         }
 
     manifest_file = DATA_DIR / "manifest.json"
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    write_json_file(manifest_file, manifest)
 
     logger.info(f"Manifest saved to {manifest_file} ({len(manifest['bills'])} bills)")
 
@@ -1185,8 +1534,7 @@ def create_sync_log(bills_count: int, status: str = "success"):
     logs.insert(0, log)
     logs = logs[:100]  # Keep last 100 entries
     
-    with open(log_file, 'w') as f:
-        json.dump({"logs": logs}, f, indent=2)
+    write_json_file(log_file, {"logs": logs})
     
     logger.info(f"Sync log updated: {status} - {bills_count} bills")
 
@@ -5,7 +5,9 @@ Incremental bill fetcher for the WA Bill Tracker.
 Instead of re-fetching all 3,500+ bills on every run, this script:
   1. Loads the existing manifest (data/manifest.json) to know what we already have
   2. Fetches the bill roster from GetLegislationByYear to find new bills
-  3. Re-fetches only stale/active bills (up to MAX_INCREMENTAL_BATCH)
+  3. Re-fetches only bills whose status changed since the last sync, found with
+     one GetLegislativeStatusChangesByDateRange call (falls back to re-fetching
+     stale/active bills, up to MAX_INCREMENTAL_BATCH, if that call fails)
   4. Merges updated bills into data/bills.json
   5. Updates the manifest
 
@@ -20,8 +22,9 @@ import argparse
 import json
 import logging
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 
 # Import shared utilities from the full fetcher
@@ -30,21 +33,26 @@ from scripts.fetch_all_bills import (
     API_BASE_URL,
     BIENNIUM,
     DATA_DIR,
-    REQUEST_DELAY,
+    MAX_WORKERS,
     YEAR,
+    agency_for_prefix,
+    bill_content_hash,
     build_bill_dict,
-    compute_content_hash,
     create_stats_file,
     create_sync_log,
     ensure_dirs,
     extract_bill_number_from_id,
+    fetch_bill_record,
     fetch_hearings_for_bills,
     get_legislation_details,
     get_legislation_list_by_year,
     get_prefiled_legislation,
     get_roll_calls,
+    get_status_changes,
     parse_governor_action,
+    roster_bill_number,
     save_bills_data,
+    write_json_file,
 )
 
 # Terminal statuses — bills in these states rarely change
@@ -80,8 +88,7 @@ def load_manifest() -> dict:
 def save_manifest(manifest: dict):
     """Write manifest to data/manifest.json."""
     manifest_path = DATA_DIR / "manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    write_json_file(manifest_path, manifest)
     logger.info(f"Manifest saved ({len(manifest.get('bills', {}))} bills)")
 
 
@@ -104,24 +111,34 @@ def load_existing_bills() -> list:
 # ---------------------------------------------------------------------------
 
 def find_new_bill_numbers(manifest: dict) -> list:
-    """Return bill numbers present in the API roster but not in the manifest."""
+    """Return bill numbers present in the API roster but not in the manifest.
+
+    Numbers are validated ints (see roster_bill_number), ready to hand to
+    fetch_bill_record; roster entries without a usable number are dropped.
+    """
     known_ids = set(manifest.get("bills", {}).keys())
 
     roster = []
+    prev_year = YEAR - 1
+
+    # The roster requests are independent, so issue them together
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        year_future = executor.submit(get_legislation_list_by_year, YEAR)
+        prev_future = executor.submit(get_legislation_list_by_year, prev_year)
+        prefiled_future = executor.submit(get_prefiled_legislation)
 
     # GetLegislationByYear for current year
-    year_bills = get_legislation_list_by_year(YEAR)
+    year_bills = year_future.result()
     logger.info(f"GetLegislationByYear({YEAR}): {len(year_bills)} bills")
     roster.extend(year_bills)
 
     # Also check previous year if we're in the same biennium
-    prev_year = YEAR - 1
-    prev_bills = get_legislation_list_by_year(prev_year)
+    prev_bills = prev_future.result()
     logger.info(f"GetLegislationByYear({prev_year}): {len(prev_bills)} bills")
     roster.extend(prev_bills)
 
     # Prefiled legislation
-    prefiled = get_prefiled_legislation()
+    prefiled = prefiled_future.result()
     logger.info(f"GetPreFiledLegislationInfo: {len(prefiled)} bills")
     roster.extend(prefiled)
 
@@ -129,8 +146,8 @@ def find_new_bill_numbers(manifest: dict) -> list:
     seen = set()
     unique_numbers = []
     for entry in roster:
-        bn = entry.get("bill_number")
-        if bn and bn not in seen:
+        bn = roster_bill_number(entry)
+        if bn > 0 and bn not in seen:
             seen.add(bn)
             # Check if any bill with this number is in the manifest
             # The manifest keys are IDs like "HB1001" (no space)
@@ -172,29 +189,75 @@ def select_bills_for_refresh(manifest: dict, max_batch: int = MAX_INCREMENTAL_BA
     return selected
 
 
+def get_last_sync_date(manifest: dict) -> str | None:
+    """Return the YYYY-MM-DD date of the last successful sync in the manifest."""
+    last_sync = manifest.get("lastIncrementalSync") or manifest.get("lastFullSync")
+    return last_sync[:10] if last_sync else None
+
+
+def select_changed_bills(manifest: dict, changes: dict,
+                         existing_by_id: dict | None = None,
+                         max_batch: int = MAX_INCREMENTAL_BATCH) -> list:
+    """Select manifest bills reported by the status-change feed.
+
+    Args:
+        manifest: Loaded manifest dict
+        changes: Output of get_status_changes(), keyed by bill number
+        existing_by_id: Current bills.json records by ID. A bill whose stored
+            historyLine already matches its latest feed entry was picked up
+            by an earlier run (the feed window overlaps the last sync by a
+            day) and is skipped.
+        max_batch: Cap on the number of bills returned; the most stale
+            (oldest lastFetched) are kept, as in select_bills_for_refresh().
+
+    Returns a list of bill IDs (manifest keys) to refresh. Bills in the feed
+    that are not in the manifest yet are new and handled by Tier 1.
+    """
+    existing_by_id = existing_by_id or {}
+    bills_meta = manifest.get("bills", {})
+    candidates = []
+    up_to_date = 0
+    for bill_id, meta in bills_meta.items():
+        _, num = extract_bill_number_from_id(bill_id)
+        change = changes.get(num)
+        if change is None:
+            continue
+        stored = existing_by_id.get(bill_id)
+        if stored and change.get("history_line") and stored.get("historyLine") == change["history_line"]:
+            up_to_date += 1
+            continue
+        candidates.append((bill_id, meta.get("lastFetched", "")))
+
+    # Sort by lastFetched ascending (most stale first)
+    candidates.sort(key=lambda x: x[1])
+
+    selected = [bill_id for bill_id, _ in candidates[:max_batch]]
+    logger.info(
+        f"Selected {len(selected)} bills with status changes for refresh "
+        f"(of {len(changes)} changed in feed, {up_to_date} already current)"
+    )
+    return selected
+
+
 # ---------------------------------------------------------------------------
 # Fetch and merge
 # ---------------------------------------------------------------------------
 
-def fetch_bill_by_id(bill_id: str) -> dict | None:
-    """Fetch full details for a single bill by its manifest ID (e.g. 'HB1001')."""
+def fetch_bill_by_id(bill_id: str, previous: dict | None = None,
+                     now_iso: str | None = None) -> dict | None:
+    """Fetch full details for a single bill by its manifest ID (e.g. 'HB1001').
+
+    ``previous`` is the bill's current record from bills.json; it lets
+    build_bill_dict() skip the roll-call request when nothing has moved.
+    """
     prefix, num = extract_bill_number_from_id(bill_id)
     if num == 0:
         return None
-    time.sleep(REQUEST_DELAY)
     details = get_legislation_details(BIENNIUM, num)
     if not details or not details.get("bill_id"):
         return None
 
-    # Determine agency
-    if prefix.endswith(("HB", "HJR", "HJM", "HCR")):
-        original_agency = "House"
-    elif prefix.endswith(("SB", "SJR", "SJM", "SCR")):
-        original_agency = "Senate"
-    else:
-        original_agency = prefix
-
-    return build_bill_dict(details, original_agency)
+    return build_bill_dict(details, agency_for_prefix(prefix), previous, now_iso)
 
 
 def merge_bills(existing: list, updated: dict) -> list:
@@ -253,65 +316,77 @@ def run_incremental():
 
     updated_bills = {}
     errors = 0
+    # One timestamp for the whole run: bill lastUpdated and manifest lastFetched
+    now = datetime.now().isoformat()
 
     # --- Tier 1: New bills ---
+    # Like the full fetch, detail requests run on a small worker pool that
+    # shares the keep-alive connection pool of the fetcher's HTTP session.
     new_numbers = find_new_bill_numbers(manifest)
-    for bn in new_numbers:
-        time.sleep(REQUEST_DELAY)
-        details = get_legislation_details(BIENNIUM, bn)
-        if details and details.get("bill_id"):
-            bill_id_raw = details["bill_id"]
-            prefix, num = extract_bill_number_from_id(bill_id_raw)
-            if prefix.endswith(("HB", "HJR", "HJM", "HCR")):
-                agency = "House"
-            elif prefix.endswith(("SB", "SJR", "SJM", "SCR")):
-                agency = "Senate"
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for bill in executor.map(partial(fetch_bill_record, now_iso=now), new_numbers):
+            if bill is not None:
+                updated_bills[bill["id"]] = bill
             else:
-                agency = prefix
-            bill = build_bill_dict(details, agency)
-            updated_bills[bill["id"]] = bill
-        else:
-            errors += 1
-            if errors > 50:
-                logger.error("Too many consecutive errors — aborting")
-                create_sync_log(len(existing_bills), "error: too many API failures")
-                return
+                errors += 1
+                if errors > 50:
+                    logger.error("Too many consecutive errors — aborting")
+                    executor.shutdown(cancel_futures=True)
+                    create_sync_log(len(existing_bills), "error: too many API failures")
+                    return
 
     logger.info(f"Tier 1 complete: {len(updated_bills)} new bills fetched")
 
-    # --- Tier 2: Stale active bills ---
+    # --- Tier 2: Bills that changed since the last sync ---
+    # One bulk status-change call replaces polling every active bill. The
+    # window starts a day before the last sync so nothing falls in a gap.
+    changes = None
+    last_sync_date = get_last_sync_date(manifest)
+    if last_sync_date:
+        try:
+            begin = datetime.fromisoformat(last_sync_date) - timedelta(days=1)
+        except ValueError:
+            logger.warning(f"Unreadable last sync date in manifest: {last_sync_date!r}")
+        else:
+            changes = get_status_changes(begin.date().isoformat(), datetime.now().date().isoformat())
+
     # Reduce batch to leave room for new bills already fetched
     remaining_budget = max(0, MAX_INCREMENTAL_BATCH - len(updated_bills))
-    stale_ids = select_bills_for_refresh(manifest, remaining_budget)
+    existing_by_id = {b.get("id", ""): b for b in existing_bills}
+    if changes is not None:
+        stale_ids = select_changed_bills(manifest, changes, existing_by_id, remaining_budget)
+    else:
+        # Fall back to refreshing the most stale active bills.
+        logger.info("Status-change feed unavailable — refreshing stale active bills")
+        stale_ids = select_bills_for_refresh(manifest, remaining_budget)
 
     stale_fetched = 0
     stale_changed = 0
-    for bill_id in stale_ids:
-        bill = fetch_bill_by_id(bill_id)
-        if bill is None:
-            errors += 1
-            if errors > 50:
-                logger.error("Too many errors — aborting stale refresh")
-                break
-            continue
-
-        # Check if content actually changed
-        new_hash = compute_content_hash(
-            bill.get("status", ""),
-            bill.get("historyLine", ""),
-            bill.get("introducedDate", ""),
-            bill.get("sponsor", ""),
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda bid: fetch_bill_by_id(bid, existing_by_id.get(bid), now), stale_ids
         )
-        old_hash = manifest.get("bills", {}).get(bill_id, {}).get("contentHash", "")
-        stale_fetched += 1
-
-        if new_hash != old_hash:
-            updated_bills[bill["id"]] = bill
-            stale_changed += 1
-        else:
-            # Still update lastFetched in manifest even if content unchanged
-            if bill_id in manifest.get("bills", {}):
-                manifest["bills"][bill_id]["lastFetched"] = datetime.now().isoformat()
+        for bill_id, bill in zip(stale_ids, results):
+            if bill is None:
+                errors += 1
+                if errors > 50:
+                    logger.error("Too many errors — aborting stale refresh")
+                    executor.shutdown(cancel_futures=True)
+                    break
+                continue
+
+            # Check if content actually changed
+            new_hash = bill_content_hash(bill)
+            old_hash = manifest.get("bills", {}).get(bill_id, {}).get("contentHash", "")
+            stale_fetched += 1
+
+            if new_hash != old_hash:
+                updated_bills[bill["id"]] = bill
+                stale_changed += 1
+            else:
+                # Still update lastFetched in manifest even if content unchanged
+                if bill_id in manifest.get("bills", {}):
+                    manifest["bills"][bill_id]["lastFetched"] = now
 
     logger.info(
         f"Tier 2 complete: {stale_fetched} bills re-fetched, "
@@ -343,28 +418,17 @@ def run_incremental():
     create_stats_file(merged)
 
     # Update manifest
-    now = datetime.now().isoformat()
     manifest["lastIncrementalSync"] = now
     manifest["billCount"] = len(merged)
+    manifest_bills = manifest.setdefault("bills", {})
     for bill in merged:
         bid = bill.get("id", "")
-        content_hash = compute_content_hash(
-            bill.get("status", ""),
-            bill.get("historyLine", ""),
-            bill.get("introducedDate", ""),
-            bill.get("sponsor", ""),
-        )
-        if bid in updated_bills:
-            manifest.setdefault("bills", {})[bid] = {
-                "status": bill.get("status", ""),
-                "contentHash": content_hash,
-                "lastFetched": now,
-            }
-        elif bid not in manifest.get("bills", {}):
-            # Bill existed in bills.json but not manifest — add it
-            manifest.setdefault("bills", {})[bid] = {
+        # Unchanged bills keep their manifest entry, so only updated bills
+        # and bills missing from the manifest need hashing
+        if bid in updated_bills or bid not in manifest_bills:
+            manifest_bills[bid] = {
                 "status": bill.get("status", ""),
-                "contentHash": content_hash,
+                "contentHash": bill_content_hash(bill),
                 "lastFetched": now,
             }
 
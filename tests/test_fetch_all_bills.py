@@ -11,6 +11,11 @@ from datetime import datetime
 from pathlib import Path
 import sys
 import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import requests
 
 # Add the scripts directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,12 +24,30 @@ from scripts.fetch_all_bills import (
     strip_namespace,
     find_element_text,
     find_all_elements,
+    child_text_map,
     extract_bill_number_from_id,
     determine_topic,
     determine_priority,
     normalize_status,
     format_bill_number,
     get_leg_url,
+    agency_for_prefix,
+    fetch_bill_record,
+    roster_bill_number,
+    build_bill_dict,
+    get_status_changes,
+    get_legislation_list_by_year,
+    write_json_file,
+    bill_sort_key,
+    RateLimiter,
+    MAX_WORKERS,
+    RECOVERY_SUCCESSES,
+    create_http_session,
+    post_soap_request,
+    MAX_RETRIES,
+    fetch_hearings_for_bills,
+    load_previous_bills,
+    create_stats_file,
     NS
 )
 
@@ -110,6 +133,21 @@ class TestXMLParsing(unittest.TestCase):
         infos = find_all_elements(root, "LegislationInfo")
         self.assertEqual(len(infos), 3)
 
+    def test_child_text_map(self):
+        """Test mapping direct children to their text in one pass"""
+        xml = f'''<Legislation xmlns="{NS}">
+            <BillId> HB 1001 </BillId>
+            <LongDescription/>
+            <CurrentStatus><BillId>HB 1001</BillId></CurrentStatus>
+            <Sponsor>Rep. Test</Sponsor>
+            <Sponsor>Rep. Other</Sponsor>
+        </Legislation>'''
+        fields = child_text_map(ET.fromstring(xml))
+        self.assertEqual(fields["BillId"], "HB 1001")
+        self.assertEqual(fields["LongDescription"], "")
+        self.assertEqual(fields["Sponsor"], "Rep. Test")
+        self.assertNotIn("Status", fields)
+
 
 class TestBillNumberExtraction(unittest.TestCase):
     """Test bill number extraction and parsing"""
@@ -301,6 +339,22 @@ class TestBillNumberFormatting(unittest.TestCase):
         self.assertEqual(format_bill_number("2SSB5001"), "2SSB 5001")
 
 
+class TestAgencyForPrefix(unittest.TestCase):
+    """Test originating chamber lookup from bill prefixes"""
+
+    def test_chambers(self):
+        """Test that versioned prefixes map to their chamber"""
+        self.assertEqual(agency_for_prefix("HB"), "House")
+        self.assertEqual(agency_for_prefix("2SHB"), "House")
+        self.assertEqual(agency_for_prefix("HJM"), "House")
+        self.assertEqual(agency_for_prefix("ESSB"), "Senate")
+        self.assertEqual(agency_for_prefix("SCR"), "Senate")
+
+    def test_unknown_prefix_passthrough(self):
+        """Test that unrecognized prefixes are returned unchanged"""
+        self.assertEqual(agency_for_prefix("XYZ"), "XYZ")
+
+
 class TestLegUrl(unittest.TestCase):
     """Test leg.wa.gov URL generation"""
     
@@ -460,5 +514,365 @@ class TestDataOutputFormat(unittest.TestCase):
             self.assertIn(result, valid_priorities)
 
 
+class TestFetchBillRecord(unittest.TestCase):
+    """Test the per-bill worker used by the concurrent detail fetch"""
+
+    @patch("scripts.fetch_all_bills.get_legislation_details")
+    def test_builds_bill_from_details(self, mock_details):
+        """Test that details are turned into a bill dict with the right chamber"""
+        mock_details.return_value = {
+            "bill_id": "SB 5001",
+            "short_description": "Concerning school funding",
+            "sponsor": "Sen. Test",
+            "status": "S Education",
+            "history_line": "First reading, referred to Early Learning & K-12 Education.",
+        }
+        bill = fetch_bill_record(5001, now_iso="2026-02-01T06:00:00")
+        self.assertEqual(bill["id"], "SB5001")
+        self.assertEqual(bill["originalAgency"], "Senate")
+        self.assertEqual(bill["topic"], "Education")
+        self.assertEqual(bill["lastUpdated"], "2026-02-01T06:00:00")
+
+    @patch("scripts.fetch_all_bills.get_legislation_details", return_value=None)
+    def test_missing_details_returns_none(self, _details):
+        """Test that bills without API details are skipped"""
+        self.assertIsNone(fetch_bill_record(9999))
+
+    @patch("scripts.fetch_all_bills.get_legislation_details")
+    def test_invalid_number_skips_request(self, mock_details):
+        """Test that an unusable bill number is rejected before any request"""
+        self.assertIsNone(fetch_bill_record(0))
+        mock_details.assert_not_called()
+
+    def test_roster_bill_number(self):
+        """Test that roster entries fall back to BillId and reject unusable numbers"""
+        self.assertEqual(roster_bill_number({"bill_number": "1001"}), 1001)
+        self.assertEqual(roster_bill_number({"bill_number": "", "bill_id": "ESSB 5002"}), 5002)
+        self.assertEqual(roster_bill_number({"bill_number": "abc", "bill_id": "HB 1003"}), 1003)
+        self.assertEqual(roster_bill_number({"bill_number": "0", "bill_id": ""}), 0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the shared request spacing and its backoff"""
+
+    def test_backs_off_and_recovers(self):
+        """Test that 429/5xx double the interval and success streaks halve it"""
+        limiter = RateLimiter(0.1, 0.3, recovery_successes=3)
+        limiter.record(503)
+        self.assertAlmostEqual(limiter.interval, 0.2)
+        limiter.record(429)
+        limiter.record(None)
+        self.assertAlmostEqual(limiter.interval, 0.3)
+        limiter.record(200)
+        limiter.record(200)
+        self.assertAlmostEqual(limiter.interval, 0.3)
+        limiter.record(200)
+        self.assertAlmostEqual(limiter.interval, 0.15)
+        for _ in range(6):
+            limiter.record(200)
+        self.assertAlmostEqual(limiter.interval, 0.1)
+
+    def test_interleaved_successes_keep_backoff(self):
+        """Test that in-flight successes from other workers do not undo a backoff"""
+        limiter = RateLimiter(0.1, 5.0)
+        # Eight workers in flight: each round one of them hits a 503 while
+        # the other seven report successes from requests sent earlier.
+        for worker in range(MAX_WORKERS):
+            for other in range(MAX_WORKERS):
+                limiter.record(503 if other == worker else 200)
+        self.assertAlmostEqual(limiter.interval, 5.0)
+        for _ in range(RECOVERY_SUCCESSES):
+            limiter.record(200)
+        self.assertAlmostEqual(limiter.interval, 2.5)
+
+    @patch("scripts.fetch_all_bills.time.sleep")
+    @patch("scripts.fetch_all_bills.time.monotonic", return_value=100.0)
+    def test_callers_get_successive_slots(self, _clock, mock_sleep):
+        """Test that back-to-back callers are spaced one interval apart"""
+        limiter = RateLimiter(0.1, 1.0)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.1)
+        self.assertAlmostEqual(waits[1], 0.2)
+
+
+class TestHttpSession(unittest.TestCase):
+    """Test the shared HTTP session configuration"""
+
+    def test_transport_does_not_retry(self):
+        """Test that the adapter leaves retries to post_soap_request"""
+        adapter = create_http_session().get_adapter("https://wslwebservices.leg.wa.gov/")
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    @patch("scripts.fetch_all_bills.RATE_LIMITER")
+    @patch("scripts.fetch_all_bills.HTTP_SESSION")
+    def test_retries_go_through_rate_limiter(self, mock_session, mock_limiter):
+        """Test that each retry takes a limiter slot and reports its status"""
+        mock_session.post.side_effect = [
+            SimpleNamespace(status_code=503, content=b""),
+            SimpleNamespace(status_code=200, content=b"<ok/>"),
+        ]
+        response = post_soap_request("https://example.test", "GetLegislation", {})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_limiter.acquire.call_count, 2)
+        self.assertEqual([c.args[0] for c in mock_limiter.record.call_args_list], [503, 200])
+
+    @patch("scripts.fetch_all_bills.RATE_LIMITER")
+    @patch("scripts.fetch_all_bills.HTTP_SESSION")
+    def test_gives_up_after_max_retries(self, mock_session, mock_limiter):
+        """Test that persistent failures stop after MAX_RETRIES retries"""
+        mock_session.post.side_effect = requests.ConnectionError("reset")
+        self.assertIsNone(post_soap_request("https://example.test", "GetLegislation", {}))
+        self.assertEqual(mock_session.post.call_count, MAX_RETRIES + 1)
+        mock_limiter.record.assert_called_with(None)
+
+
+class TestFetchHearingsForBills(unittest.TestCase):
+    """Test attaching hearings from concurrently fetched agendas"""
+
+    MEETINGS = [
+        {"agendaId": 1, "date": "2026-02-02", "time": "08:00",
+         "committee": "Finance", "room": "A", "agency": "House"},
+        {"agendaId": 2, "date": "2026-02-03", "time": "10:00",
+         "committee": "Broken", "room": "B", "agency": "House"},
+        {"agendaId": 3, "date": "2026-02-04", "time": "13:30",
+         "committee": "Appropriations", "room": "C", "agency": "House"},
+    ]
+
+    @staticmethod
+    def _agenda(agenda_id):
+        if agenda_id == 2:
+            raise RuntimeError("agenda unavailable")
+        return [{"billId": "ESHB1001", "hearingType": "Public Hearing"}]
+
+    @patch("scripts.fetch_all_bills.get_meeting_agenda_items")
+    @patch("scripts.fetch_all_bills.get_committee_meetings")
+    def test_hearings_keep_meeting_order(self, mock_meetings, mock_agenda):
+        """Test that hearings attach in meeting order and failed agendas are skipped"""
+        mock_meetings.return_value = self.MEETINGS
+        mock_agenda.side_effect = self._agenda
+        bills = [{"id": "HB1001", "hearings": []}]
+        fetch_hearings_for_bills(bills)
+        self.assertEqual(
+            [h["committee"] for h in bills[0]["hearings"]],
+            ["Finance", "Appropriations"]
+        )
+
+
+class TestLoadPreviousBills(unittest.TestCase):
+    """Test loading the last run's bills for reuse in a full fetch"""
+
+    def test_keys_by_bill_number(self):
+        """Test that bills are keyed by number, whatever their version prefix"""
+        with tempfile.TemporaryDirectory() as tmp:
+            data = {"bills": [{"id": "ESHB1001", "votes": []}, {"id": "SB5001"}]}
+            (Path(tmp) / "bills.json").write_text(json.dumps(data))
+            with patch("scripts.fetch_all_bills.DATA_DIR", Path(tmp)):
+                previous = load_previous_bills()
+        self.assertEqual(sorted(previous), [1001, 5001])
+        self.assertEqual(previous[1001]["id"], "ESHB1001")
+
+    def test_missing_or_corrupt_file(self):
+        """Test that an unusable previous file yields no records"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("scripts.fetch_all_bills.DATA_DIR", Path(tmp)):
+                self.assertEqual(load_previous_bills(), {})
+                (Path(tmp) / "bills.json").write_text("{not json")
+                self.assertEqual(load_previous_bills(), {})
+
+
+class TestCreateStatsFile(unittest.TestCase):
+    """Test the stats.json aggregation"""
+
+    def test_counts_and_recency(self):
+        """Test per-field counts, key order and recently updated totals"""
+        now = datetime.now().isoformat()
+        bills = [
+            {"number": "HB 1001", "status": "committee", "committee": "Finance",
+             "sponsor": "Rep. A", "originalAgency": "House", "lastUpdated": now},
+            {"number": "SB 5001", "status": "floor", "committee": "",
+             "sponsor": "Sen. B", "originalAgency": "Senate",
+             "lastUpdated": "2020-01-01T00:00:00"},
+            {"number": "ESHB 1002", "status": "committee", "committee": "Finance",
+             "sponsor": "Rep. A", "originalAgency": "House", "lastUpdated": "bad"},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("scripts.fetch_all_bills.DATA_DIR", Path(tmp)):
+                create_stats_file(bills)
+            stats = json.loads((Path(tmp) / "stats.json").read_text())
+        self.assertEqual(list(stats["byStatus"].items()), [("committee", 2), ("floor", 1)])
+        self.assertEqual(stats["byCommittee"], {"Finance": 2, "Unassigned": 1})
+        self.assertEqual(stats["byType"], {"HB": 2, "SB": 1})
+        self.assertEqual(stats["topSponsors"][0], ["Rep. A", 2])
+        self.assertEqual(stats["updatedToday"], 1)
+        self.assertEqual(stats["recentlyUpdated"], 1)
+
+
+class TestBuildBillDictVoteReuse(unittest.TestCase):
+    """Test that stored votes are reused when a bill has not moved"""
+
+    DETAILS = {
+        "bill_id": "HB 1001",
+        "short_description": "Fire protection projects",
+        "status": "S Ways & Means",
+        "history_line": "Referred to Ways & Means.",
+    }
+    VOTES = [{"chamber": "House", "date": "2026-02-10", "motion": "Final Passage",
+              "yeas": 97, "nays": 0, "absent": 0, "excused": 1, "passed": True}]
+
+    @patch("scripts.fetch_all_bills.get_roll_calls")
+    def test_reuses_votes_when_history_unchanged(self, mock_roll_calls):
+        """Test that an unchanged history line keeps the stored votes without a request"""
+        previous = {"id": "HB1001", "historyLine": "Referred to Ways & Means.", "votes": self.VOTES}
+        bill = build_bill_dict(self.DETAILS, "House", previous)
+        self.assertEqual(bill["votes"], self.VOTES)
+        mock_roll_calls.assert_not_called()
+
+    @patch("scripts.fetch_all_bills.get_roll_calls", return_value=[])
+    def test_refetches_votes_when_history_changed(self, mock_roll_calls):
+        """Test that a new history line triggers a fresh roll-call fetch"""
+        previous = {"id": "HB1001", "historyLine": "Third reading, passed.", "votes": self.VOTES}
+        build_bill_dict(self.DETAILS, "House", previous)
+        mock_roll_calls.assert_called_once()
+
+
+class TestGetStatusChanges(unittest.TestCase):
+    """Test parsing of the bulk status-change feed"""
+
+    XML = f'''<?xml version="1.0" encoding="utf-8"?>
+    <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+        <soap:Body>
+            <GetLegislativeStatusChangesByDateRangeResponse xmlns="{NS}">
+                <GetLegislativeStatusChangesByDateRangeResult>
+                    <LegislativeStatus>
+                        <BillId>HB 1001</BillId>
+                        <HistoryLine>Third reading, passed; yeas, 97; nays, 0.</HistoryLine>
+                        <ActionDate>2026-02-10T00:00:00</ActionDate>
+                        <Status>H Passed 3rd</Status>
+                    </LegislativeStatus>
+                    <LegislativeStatus>
+                        <BillId>HB 1001</BillId>
+                        <HistoryLine>First reading, referred to Ways &amp; Means.</HistoryLine>
+                        <ActionDate>2026-02-12T00:00:00</ActionDate>
+                        <Status>S Ways &amp; Means</Status>
+                    </LegislativeStatus>
+                    <LegislativeStatus>
+                        <BillId>ESSB 5002</BillId>
+                        <HistoryLine>Delivered to Governor.</HistoryLine>
+                        <ActionDate>2026-03-01T00:00:00</ActionDate>
+                        <Status>Del to Gov</Status>
+                    </LegislativeStatus>
+                </GetLegislativeStatusChangesByDateRangeResult>
+            </GetLegislativeStatusChangesByDateRangeResponse>
+        </soap:Body>
+    </soap:Envelope>'''
+
+    @patch("scripts.fetch_all_bills.make_soap_request")
+    def test_keeps_latest_change_per_bill(self, mock_request):
+        """Test that changes are keyed by bill number with the latest action"""
+        mock_request.return_value = ET.fromstring(self.XML)
+        changes = get_status_changes("2026-02-01", "2026-03-01")
+        self.assertEqual(set(changes), {1001, 5002})
+        self.assertEqual(changes[1001]["status"], "S Ways & Means")
+        self.assertEqual(changes[5002]["bill_id"], "ESSB 5002")
+
+    @patch("scripts.fetch_all_bills.make_soap_request", return_value=None)
+    def test_request_failure_returns_none(self, _request):
+        """Test that a failed call is distinguishable from no changes"""
+        self.assertIsNone(get_status_changes("2026-02-01", "2026-03-01"))
+
+
+class TestStreamedLegislationList(unittest.TestCase):
+    """Test the iterparse-based GetLegislationByYear parsing"""
+
+    XML = f'''<?xml version="1.0" encoding="utf-8"?>
+    <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+        <soap:Body>
+            <GetLegislationByYearResponse xmlns="{NS}">
+                <GetLegislationByYearResult>
+                    <LegislationInfo>
+                        <Biennium>2025-26</Biennium>
+                        <BillId>HB 1001</BillId>
+                        <BillNumber>1001</BillNumber>
+                        <OriginalAgency>House</OriginalAgency>
+                        <Active>true</Active>
+                    </LegislationInfo>
+                    <LegislationInfo>
+                        <Biennium>2025-26</Biennium>
+                        <BillId>SB 5001</BillId>
+                        <BillNumber>5001</BillNumber>
+                        <OriginalAgency>Senate</OriginalAgency>
+                        <Active>false</Active>
+                    </LegislationInfo>
+                </GetLegislationByYearResult>
+            </GetLegislationByYearResponse>
+        </soap:Body>
+    </soap:Envelope>'''
+
+    @patch("scripts.fetch_all_bills.post_soap_request")
+    def test_streams_all_legislation_info(self, mock_post):
+        """Test that every LegislationInfo becomes a bill entry"""
+        mock_post.return_value = SimpleNamespace(content=self.XML.encode("utf-8"))
+        bills = get_legislation_list_by_year(2026)
+        self.assertEqual([b["bill_id"] for b in bills], ["HB 1001", "SB 5001"])
+        self.assertEqual(bills[1]["original_agency"], "Senate")
+        self.assertFalse(bills[1]["active"])
+
+    @patch("scripts.fetch_all_bills.post_soap_request", return_value=None)
+    def test_request_failure_returns_empty(self, _post):
+        """Test that a failed request yields no bills"""
+        self.assertEqual(get_legislation_list_by_year(2026), [])
+
+    @patch("scripts.fetch_all_bills.post_soap_request")
+    def test_truncated_response_returns_empty(self, mock_post):
+        """Test that a response cut off after some bills yields none of them"""
+        cut = self.XML.index("<BillId>SB 5001")
+        mock_post.return_value = SimpleNamespace(content=self.XML[:cut].encode("utf-8"))
+        self.assertEqual(get_legislation_list_by_year(2026), [])
+
+
+class TestBillSortKey(unittest.TestCase):
+    """Test the bills.json ordering key"""
+
+    def test_orders_by_type_then_number(self):
+        """Test that House bills come before Senate bills, each by number"""
+        bills = [{"number": "SB 5001"}, {"number": "ESHB 1200"},
+                 {"number": "HB 1001"}, {"number": "2SSB 5000"}]
+        bills.sort(key=bill_sort_key)
+        self.assertEqual([b["number"] for b in bills],
+                         ["HB 1001", "ESHB 1200", "2SSB 5000", "SB 5001"])
+
+    def test_unknown_number_sorts_last(self):
+        """Test that bills with a missing number sort after known types"""
+        self.assertEqual(bill_sort_key({}), (99, 0))
+
+
+class TestWriteJsonFile(unittest.TestCase):
+    """Test the atomic JSON writer used for all data files"""
+
+    def test_matches_json_dump_output(self):
+        """Test that output is byte-identical to json.dump with indent=2"""
+        data = {"bills": [{"id": "HB1001", "title": "Caf\u00e9 workers"}], "totalBills": 1}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bills.json"
+            write_json_file(path, data, ensure_ascii=False)
+            self.assertEqual(
+                path.read_text(encoding="utf-8"),
+                json.dumps(data, indent=2, ensure_ascii=False)
+            )
+            self.assertEqual(os.listdir(tmp), ["bills.json"])
+
+    def test_replaces_existing_file(self):
+        """Test that an existing file is overwritten"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "stats.json"
+            path.write_text("stale")
+            write_json_file(path, {"totalBills": 2})
+            self.assertEqual(json.loads(path.read_text()), {"totalBills": 2})
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
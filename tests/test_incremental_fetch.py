@@ -13,12 +13,16 @@ from unittest.mock import patch
 # Ensure project root is on the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.fetch_all_bills import compute_content_hash
+from scripts.fetch_all_bills import BIENNIUM, bill_content_hash, compute_content_hash
 from scripts.fetch_bills_incremental import (
+    MAX_INCREMENTAL_BATCH,
     TERMINAL_STATUSES,
+    get_last_sync_date,
     load_manifest,
     merge_bills,
+    run_incremental,
     select_bills_for_refresh,
+    select_changed_bills,
 )
 
 
@@ -44,6 +48,17 @@ class TestComputeContentHash(unittest.TestCase):
         # Should be valid hex
         int(h, 16)
 
+    def test_bill_dict_hash(self):
+        """Hashing a bill dict matches hashing its tracked fields."""
+        bill = {
+            "status": "committee", "historyLine": "line",
+            "introducedDate": "2026-01-01", "sponsor": "Jones", "title": "ignored",
+        }
+        self.assertEqual(
+            bill_content_hash(bill),
+            compute_content_hash("committee", "line", "2026-01-01", "Jones"),
+        )
+
 
 class TestSelectBillsForRefresh(unittest.TestCase):
     """Tests for select_bills_for_refresh()."""
@@ -89,6 +104,63 @@ class TestSelectBillsForRefresh(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestSelectChangedBills(unittest.TestCase):
+    """Tests for select_changed_bills() and get_last_sync_date()."""
+
+    def test_selects_bills_in_feed(self):
+        """Only manifest bills whose number appears in the feed are selected."""
+        manifest = {"bills": {
+            "HB1001": {"status": "committee"},
+            "ESSB5002": {"status": "floor"},
+            "HB1003": {"status": "enacted"},
+        }}
+        changes = {5002: {"bill_id": "2SSB 5002"}, 1003: {"bill_id": "HB 1003"}}
+        result = select_changed_bills(manifest, changes)
+        self.assertEqual(sorted(result), ["ESSB5002", "HB1003"])
+
+    def test_skips_bills_already_current(self):
+        """Bills whose stored history line matches the feed are not re-fetched."""
+        manifest = {"bills": {
+            "HB1001": {"status": "committee"},
+            "HB1002": {"status": "committee"},
+        }}
+        changes = {
+            1001: {"bill_id": "HB 1001", "history_line": "Referred to Finance."},
+            1002: {"bill_id": "HB 1002", "history_line": "Passed to Rules for second reading."},
+        }
+        existing_by_id = {
+            "HB1001": {"id": "HB1001", "historyLine": "Referred to Finance."},
+            "HB1002": {"id": "HB1002", "historyLine": "Referred to Finance."},
+        }
+        result = select_changed_bills(manifest, changes, existing_by_id)
+        self.assertEqual(result, ["HB1002"])
+
+    def test_empty_feed(self):
+        """No changes means nothing to refresh."""
+        manifest = {"bills": {"HB1001": {"status": "committee"}}}
+        self.assertEqual(select_changed_bills(manifest, {}), [])
+
+    def test_caps_batch_most_stale_first(self):
+        """Only max_batch bills are returned, oldest lastFetched first."""
+        manifest = {"bills": {
+            "HB1001": {"status": "committee", "lastFetched": "2026-02-03T00:00:00"},
+            "HB1002": {"status": "committee", "lastFetched": "2026-02-01T00:00:00"},
+            "HB1003": {"status": "committee", "lastFetched": "2026-02-02T00:00:00"},
+        }}
+        changes = {1001: {}, 1002: {}, 1003: {}}
+        result = select_changed_bills(manifest, changes, max_batch=2)
+        self.assertEqual(result, ["HB1002", "HB1003"])
+
+    def test_last_sync_date(self):
+        """Prefers the incremental sync time and trims it to a date."""
+        manifest = {
+            "lastFullSync": "2026-04-27T16:17:16",
+            "lastIncrementalSync": "2026-05-01T15:05:19",
+        }
+        self.assertEqual(get_last_sync_date(manifest), "2026-05-01")
+        self.assertIsNone(get_last_sync_date({}))
+
+
 class TestLoadManifest(unittest.TestCase):
     """Tests for load_manifest()."""
 
@@ -152,5 +224,90 @@ class TestMergeBills(unittest.TestCase):
             os.unlink(tmp_path)
 
 
+class TestRunIncremental(unittest.TestCase):
+    """Tests for the Tier 1 (new bill) path of run_incremental()."""
+
+    MANIFEST = {
+        "lastIncrementalSync": "2026-02-01T06:00:00",
+        "bills": {"HB1001": {"status": "committee", "contentHash": "abc12345",
+                             "lastFetched": "2026-02-01T06:00:00"}},
+    }
+    EXISTING = [{"id": "HB1001", "number": "HB 1001", "status": "committee",
+                 "historyLine": "Referred to Finance.", "hearings": []}]
+    ROSTER = [
+        {"bill_id": "HB 1001", "bill_number": "1001"},
+        {"bill_id": "HB 9999", "bill_number": "9999"},
+        {"bill_id": "", "bill_number": ""},
+    ]
+
+    @staticmethod
+    def _details(biennium, bill_number):
+        return {
+            "bill_id": f"HB {bill_number}",
+            "short_description": "Concerning new things",
+            "status": "H Finance",
+            "history_line": "First reading, referred to Finance.",
+            "introduced_date": "2026-02-02T00:00:00",
+            "sponsor": "Smith",
+        }
+
+    @patch("scripts.fetch_bills_incremental.create_sync_log")
+    @patch("scripts.fetch_bills_incremental.save_manifest")
+    @patch("scripts.fetch_bills_incremental.create_stats_file")
+    @patch("scripts.fetch_bills_incremental.save_bills_data")
+    @patch("scripts.fetch_bills_incremental.fetch_hearings_for_bills")
+    @patch("scripts.fetch_bills_incremental.get_status_changes", return_value={})
+    @patch("scripts.fetch_all_bills.get_legislation_details")
+    @patch("scripts.fetch_bills_incremental.get_prefiled_legislation", return_value=[])
+    @patch("scripts.fetch_bills_incremental.get_legislation_list_by_year")
+    @patch("scripts.fetch_bills_incremental.load_existing_bills")
+    @patch("scripts.fetch_bills_incremental.load_manifest")
+    @patch("scripts.fetch_bills_incremental.ensure_dirs")
+    def test_fetches_new_roster_bills(self, _dirs, mock_manifest, mock_existing,
+                                      mock_roster, _prefiled, mock_details, _changes,
+                                      _hearings, mock_save, _stats, _manifest_save,
+                                      mock_log):
+        """New roster bills are fetched by integer number and merged in."""
+        mock_manifest.return_value = json.loads(json.dumps(self.MANIFEST))
+        mock_existing.return_value = json.loads(json.dumps(self.EXISTING))
+        mock_roster.return_value = self.ROSTER
+        mock_details.side_effect = self._details
+
+        run_incremental()
+
+        mock_details.assert_called_once_with(BIENNIUM, 9999)
+        saved_ids = [b["id"] for b in mock_save.call_args[0][0]]
+        self.assertEqual(saved_ids, ["HB1001", "HB9999"])
+        mock_log.assert_called_once_with(2, "success_incremental")
+
+    @patch("scripts.fetch_bills_incremental.create_sync_log")
+    @patch("scripts.fetch_bills_incremental.save_manifest")
+    @patch("scripts.fetch_bills_incremental.create_stats_file")
+    @patch("scripts.fetch_bills_incremental.save_bills_data")
+    @patch("scripts.fetch_bills_incremental.fetch_hearings_for_bills")
+    @patch("scripts.fetch_bills_incremental.select_bills_for_refresh", return_value=[])
+    @patch("scripts.fetch_bills_incremental.get_status_changes")
+    @patch("scripts.fetch_bills_incremental.get_prefiled_legislation", return_value=[])
+    @patch("scripts.fetch_bills_incremental.get_legislation_list_by_year", return_value=[])
+    @patch("scripts.fetch_bills_incremental.load_existing_bills")
+    @patch("scripts.fetch_bills_incremental.load_manifest")
+    @patch("scripts.fetch_bills_incremental.ensure_dirs")
+    def test_unreadable_sync_date_falls_back(self, _dirs, mock_manifest, mock_existing,
+                                             _roster, _prefiled, mock_changes, mock_refresh,
+                                             _hearings, _save, _stats, _manifest_save,
+                                             mock_log):
+        """A malformed last sync date skips the feed and refreshes stale bills."""
+        manifest = json.loads(json.dumps(self.MANIFEST))
+        manifest["lastIncrementalSync"] = "not-a-date"
+        mock_manifest.return_value = manifest
+        mock_existing.return_value = json.loads(json.dumps(self.EXISTING))
+
+        run_incremental()
+
+        mock_changes.assert_not_called()
+        mock_refresh.assert_called_once_with(manifest, MAX_INCREMENTAL_BATCH)
+        mock_log.assert_called_once_with(1, "success_incremental")
+
+
 if __name__ == "__main__":
     unittest.main()